@@ -20,10 +20,12 @@ class Response:
         *,
         json_data: Any | None = None,
         text: str | None = None,
+        headers: Dict[str, str] | None = None,
     ) -> None:
         self.status_code = status_code
         self._json_data = json_data
         self.text = text or ""
+        self.headers: Dict[str, str] = dict(headers or {})
 
     def json(self) -> Any:
         if self._json_data is not None:
@@ -53,6 +55,9 @@ class Session:
     def patch(self, url: str, timeout: float | None = None, **kwargs: Any) -> Response:
         return self.request("PATCH", url, timeout=timeout, **kwargs)
 
+    def close(self) -> None:
+        pass
+
 
 def _set_mock_dispatcher(dispatcher: Optional[Dispatcher]) -> None:
     global _mock_dispatcher
@@ -21,6 +21,7 @@ class _Mock:
     status: int
     body: Optional[str]
     json_data: Any
+    headers: Optional[Dict[str, str]] = None
 
 
 _active: List["RequestsMock"] = []
@@ -39,8 +40,9 @@ class RequestsMock(ContextDecorator):
         body: str | None = None,
         json: Any | None = None,
         status: int = 200,
+        headers: Dict[str, str] | None = None,
     ) -> None:
-        self._mocks.append(_Mock(method.upper(), url, status, body, json))
+        self._mocks.append(_Mock(method.upper(), url, status, body, json, headers))
 
     def _dispatch(
         self,
@@ -54,7 +56,7 @@ class RequestsMock(ContextDecorator):
                 self.calls.append({"method": method, "url": url, "kwargs": kwargs})
                 self._mocks.pop(idx)
                 return requests.Response(
-                    mock.status, json_data=mock.json_data, text=mock.body
+                    mock.status, json_data=mock.json_data, text=mock.body, headers=mock.headers
                 )
         raise requests.RequestException(
             f"No mock registered for {method} {url}"
@@ -79,10 +81,11 @@ def add(
     body: str | None = None,
     json: Any | None = None,
     status: int = 200,
+    headers: Dict[str, str] | None = None,
 ) -> None:
     if not _active:
         raise RuntimeError("responses.add must be called within an active context")
-    _active[-1].add(method, url, body=body, json=json, status=status)
+    _active[-1].add(method, url, body=body, json=json, status=status, headers=headers)
 
 
 def activate(func):
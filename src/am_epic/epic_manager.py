@@ -32,7 +32,7 @@ class EpicManager:
         epic_number = epic["number"]
         logger.info("Epic #%s ready", epic_number)
 
-        child_numbers: List[int] = []
+        child_issues: List[Dict] = []
         for child in spec.children:
             # Ensure child exists
             child_labels = list({*child.labels, "epic-child"})
@@ -43,23 +43,24 @@ class EpicManager:
                 child.assignees,
             )
             child_number = child_issue["number"]
-            child_numbers.append(child_number)
+            child_issues.append(child_issue)
 
             # Comment on child linking back to epic (idempotent-update)
             self._ensure_child_comment(child_number, epic_number)
 
-        # Update epic body with dynamic checklist
+        # Update epic body with dynamic checklist. The child issue payloads from
+        # the upsert above are reused, so no per-child GET is needed here.
         updated_body = self._build_epic_body_with_checklist(
             epic.get("body") or spec.body,
-            child_numbers,
+            child_issues,
         )
         if updated_body != epic.get("body"):
             epic = self.gh.update_issue(epic_number, body=updated_body)
 
         # Add or update an epic comment listing the children
-        self._ensure_epic_comment(epic_number, child_numbers)
+        self._ensure_epic_comment(epic_number, child_issues)
 
-        return {"epic": epic_number, "children": len(child_numbers)}
+        return {"epic": epic_number, "children": len(child_issues)}
 
     def _upsert_issue(
         self, title: str, body: str, labels: List[str], assignees: List[str]
@@ -80,11 +81,11 @@ class EpicManager:
             return existing
         return self.gh.create_issue(title=title, body=body, labels=labels, assignees=assignees)
 
-    def _build_epic_body_with_checklist(self, base_body: str, child_numbers: List[int]) -> str:
+    def _build_epic_body_with_checklist(self, base_body: str, child_issues: List[Dict]) -> str:
         # Compose checklist section
         lines = ["## Progress", "", "- [ ] Link and track child issues:"]
-        for n in child_numbers:
-            issue = self.gh.get_issue(n)
+        for issue in child_issues:
+            n = issue["number"]
             checked = issue.get("state") == "closed"
             title = issue.get("title", "")
             checkbox = "x" if checked else " "
@@ -101,16 +102,15 @@ class EpicManager:
             new_body = f"{base_body}{sep}{CHECKLIST_START}\n{checklist}\n{CHECKLIST_END}"
         return new_body
 
-    def _ensure_epic_comment(self, epic_number: int, child_numbers: List[int]) -> None:
+    def _ensure_epic_comment(self, epic_number: int, child_issues: List[Dict]) -> None:
         comment_body = [
             EPIC_COMMENT_MARKER,
             "Child issues for this Epic:",
             "",
         ]
-        for n in child_numbers:
-            issue = self.gh.get_issue(n)
+        for issue in child_issues:
             issue_title = issue.get("title", "")
-            comment_body.append(f"- #{n} {issue_title}")
+            comment_body.append(f"- #{issue['number']} {issue_title}")
         body = "\n".join(comment_body)
 
         comments = self.gh.list_comments(epic_number)
@@ -1,6 +1,9 @@
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -8,6 +11,10 @@ logger = logging.getLogger(__name__)
 class GitHubAPIError(RuntimeError):
     """Raised for GitHub API related errors."""
 
+    def __init__(self, message: str, status_code: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
 
 class GitHubClient:
     """
@@ -17,7 +24,22 @@ class GitHubClient:
     clear error messages/logging. It is designed to be testable via HTTP mockers.
     """
 
-    def __init__(self, token: str, repo: str, api_url: str = "https://api.github.com") -> None:
+    # Transient server errors worth retrying; 429/rate-limited 403s are always retried
+    RETRY_STATUSES = frozenset({500, 502, 503, 504})
+    # Methods safe to repeat after a server error (the request may have been applied)
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+    MAX_BACKOFF_SECONDS = 60.0
+    # Pause before the next call once a response leaves this much quota or less
+    RATE_LIMIT_LOW_WATER = 1
+
+    def __init__(
+        self,
+        token: str,
+        repo: str,
+        api_url: str = "https://api.github.com",
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+    ) -> None:
         if not token:
             raise ValueError("GitHub token is required")
         if not repo or "/" not in repo:
@@ -25,20 +47,62 @@ class GitHubClient:
         self.token = token
         self.owner, self.repo = repo.split("/", 1)
         self.base_url = api_url.rstrip("/")
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.session = self._new_session()
+        # Per-thread sessions for bulk workers; requests.Session is not thread-safe
+        self._local = threading.local()
+        # Epoch seconds before which no request is sent (quota nearly exhausted)
+        self._throttle_until = 0.0
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update({
             "Authorization": f"token {self.token}",
             "Accept": "application/vnd.github+json",
             "User-Agent": "am-epic-bot/1.0"
         })
+        return session
 
     def _request(self, method: str, path: str, **kwargs) -> requests.Response:
         url = f"{self.base_url}{path}"
-        try:
-            resp = self.session.request(method, url, timeout=30, **kwargs)
-        except requests.RequestException as e:
-            logger.exception("GitHub request failed: %s %s", method, url)
-            raise GitHubAPIError(str(e)) from e
+        session = getattr(self._local, "session", None) or self.session
+        attempt = 0
+        while True:
+            wait = self._throttle_until - time.time()
+            if wait > 0:
+                logger.info("GitHub rate limit nearly exhausted; waiting %.1fs", wait)
+                time.sleep(wait)
+            try:
+                resp = session.request(method, url, timeout=30, **kwargs)
+            except requests.RequestException as e:
+                # Connection errors and timeouts: retry only if repeating is safe
+                if attempt < self.max_retries and method.upper() in self.IDEMPOTENT_METHODS:
+                    delay = self.backoff_factor * (2 ** attempt)
+                    logger.warning(
+                        "GitHub request %s %s failed (%s); retrying in %.1fs",
+                        method,
+                        url,
+                        e,
+                        delay,
+                    )
+                    time.sleep(delay)
+                    attempt += 1
+                    continue
+                logger.exception("GitHub request failed: %s %s", method, url)
+                raise GitHubAPIError(str(e)) from e
+            delay = self._retry_delay(method, resp, attempt)
+            if delay is None:
+                break
+            logger.warning(
+                "GitHub returned %s for %s %s; retrying in %.1fs",
+                resp.status_code,
+                method,
+                url,
+                delay,
+            )
+            time.sleep(delay)
+            attempt += 1
         if resp.status_code >= 400:
             try:
                 detail = resp.json()
@@ -46,17 +110,76 @@ class GitHubClient:
                 detail = {"message": resp.text}
             msg = f"GitHub API error {resp.status_code} for {method} {url}: {detail}"
             logger.error(msg)
-            raise GitHubAPIError(msg)
+            raise GitHubAPIError(msg, status_code=resp.status_code)
+        self._note_rate_limit(resp)
         return resp
 
+    def _note_rate_limit(self, resp: requests.Response) -> None:
+        """Schedule a pause until the reset when ``resp`` shows almost no quota left.
+
+        Resets further away than MAX_BACKOFF_SECONDS are not waited for; the
+        next call then fails fast on its 403 instead (see _retry_delay).
+        """
+        remaining = resp.headers.get("X-RateLimit-Remaining")
+        reset = resp.headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            low = int(remaining) <= self.RATE_LIMIT_LOW_WATER
+            reset_at = float(reset)
+        except ValueError:
+            return
+        if low and 0 < reset_at - time.time() <= self.MAX_BACKOFF_SECONDS:
+            self._throttle_until = reset_at
+
+    def _retry_delay(self, method: str, resp: requests.Response, attempt: int) -> Optional[float]:
+        """Return seconds to wait before retrying ``resp``, or None to give up.
+
+        Rate limiting (429, or 403 with no remaining quota or with Retry-After,
+        as sent for secondary limits) is retried for any method since GitHub did
+        not process the request. Server errors are retried only for idempotent
+        methods. Retry-After and X-RateLimit-Reset are honored; otherwise
+        exponential backoff is used. Waits longer than MAX_BACKOFF_SECONDS give
+        up immediately rather than blocking and failing anyway.
+        """
+        if attempt >= self.max_retries:
+            return None
+        status = resp.status_code
+        headers = resp.headers
+        rate_limited = status == 429 or (
+            status == 403
+            and (
+                headers.get("X-RateLimit-Remaining") == "0"
+                or headers.get("Retry-After") is not None
+            )
+        )
+        if not rate_limited and not (
+            status in self.RETRY_STATUSES and method.upper() in self.IDEMPOTENT_METHODS
+        ):
+            return None
+        delay = self.backoff_factor * (2 ** attempt)
+        retry_after = headers.get("Retry-After")
+        reset = headers.get("X-RateLimit-Reset")
+        try:
+            if retry_after is not None:
+                delay = float(retry_after)
+            elif rate_limited and reset is not None:
+                delay = float(reset) - time.time()
+        except ValueError:
+            pass
+        if delay > self.MAX_BACKOFF_SECONDS:
+            return None
+        return max(delay, 0.0)
+
     # Labels
     def get_label(self, name: str) -> Optional[Dict[str, Any]]:
-        resp = self.session.get(
-            f"{self.base_url}/repos/{self.owner}/{self.repo}/labels/{name}", timeout=30
-        )
-        if resp.status_code == 200:
-            return resp.json()
-        return None
+        try:
+            resp = self._request("GET", f"/repos/{self.owner}/{self.repo}/labels/{name}")
+        except GitHubAPIError as e:
+            if e.status_code == 404:
+                return None
+            raise
+        return resp.json()
 
     def ensure_label(
         self,
@@ -120,6 +243,44 @@ class GitHubClient:
         )
         return resp.json()
 
+    def create_issues_bulk(
+        self,
+        specs: Sequence[Dict[str, Any]],
+        max_workers: int = 2,
+    ) -> List[Dict[str, Any]]:
+        """Create several issues, optionally overlapping up to ``max_workers`` requests.
+
+        Each spec holds create_issue keyword arguments (title, body, labels,
+        assignees). Results are returned in the same order as ``specs``. GitHub
+        asks for content-creating requests to be sent serially and answers bursts
+        with secondary rate limits (retried by _request), so keep the worker
+        count small; ``max_workers=1`` creates the issues one by one. Each worker
+        uses its own Session. Labels referenced by the specs should exist
+        beforehand (see ensure_label) so workers do not race to create them. The
+        first failure is re-raised once every request has finished.
+        """
+        if not specs:
+            return []
+        workers = max(1, min(max_workers, len(specs)))
+        if workers == 1:
+            return [self.create_issue(**spec) for spec in specs]
+        sessions: List[requests.Session] = []
+        lock = threading.Lock()
+
+        def init_worker() -> None:
+            session = self._new_session()
+            self._local.session = session
+            with lock:
+                sessions.append(session)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+                futures = [pool.submit(self.create_issue, **spec) for spec in specs]
+            return [f.result() for f in futures]
+        finally:
+            for session in sessions:
+                session.close()
+
     def update_issue(
         self,
         number: int,
@@ -10,42 +10,51 @@ This package provides headless domain logic for the Graveyard hub including:
 
 UI layers (Arcade, CLI, etc.) should import and compose these services.
 """
-from .models import Item, ItemCatalog, Inventory, Player
-from .hub import GraveyardHub
-from .shop import Shop
-from .crypt import Crypt
-from .save import SaveManager, SaveData
-from .errors import (
-    AmorError,
-    InsufficientGold,
-    OutOfStock,
-    CryptFull,
-    InvalidOperation,
-    NotFound,
-)
+from __future__ import annotations
 
+from importlib import import_module
 from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Dict
+
+# Public name -> submodule that defines it. Submodules are imported on first
+# attribute access (PEP 562) so that e.g. the CLI or a single subsystem's tests
+# do not pay for loading the whole domain layer up front.
+_LAZY_ATTRS: Dict[str, str] = {
+    "Item": ".models",
+    "ItemCatalog": ".models",
+    "Inventory": ".models",
+    "Player": ".models",
+    "GraveyardHub": ".hub",
+    "Shop": ".shop",
+    "Crypt": ".crypt",
+    "SaveManager": ".save",
+    "SaveData": ".save",
+    "AmorError": ".errors",
+    "InsufficientGold": ".errors",
+    "OutOfStock": ".errors",
+    "CryptFull": ".errors",
+    "InvalidOperation": ".errors",
+    "NotFound": ".errors",
+}
+
+__all__ = list(_LAZY_ATTRS)
 
-__all__ = [
-    "Item",
-    "ItemCatalog",
-    "Inventory",
-    "Player",
-    "GraveyardHub",
-    "Shop",
-    "Crypt",
-    "SaveManager",
-    "SaveData",
-    "AmorError",
-    "InsufficientGold",
-    "OutOfStock",
-    "CryptFull",
-    "InvalidOperation",
-    "NotFound",
-]
 try:
-    __version__ = version("amormortuorum")
+    __version__ = version("amor-mortuorum")
 except PackageNotFoundError:  # pragma: no cover
-    __version__ = "0.0.0"
+    __version__ = "0.1.0"
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache in module globals so subsequent lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
 
-__version__ = "0.1.0"
+def __dir__() -> list:
+    return sorted({*globals(), *__all__})
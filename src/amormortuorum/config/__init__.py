@@ -5,6 +5,11 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict
 
+try:  # Optional C-accelerated JSON codec; stdlib json is the fallback
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
 
 # Default item catalog, can be overridden by data files later.
 DEFAULT_ITEMS: Dict[str, Dict] = {
@@ -72,10 +77,19 @@ def get_paths(root: Path | None = None) -> Paths:
 
 
 def load_json(path: Path) -> Dict:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
 
 def dump_json(path: Path, data: Dict) -> None:
+    """Write ``data`` as indented, key-sorted JSON.
+
+    Uses orjson when available; the stdlib fallback produces identical output.
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+        return
     with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, sort_keys=True)
+        json.dump(data, f, indent=2, sort_keys=True, ensure_ascii=False)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 from typing import Dict, Iterable, List, Set
 
@@ -22,6 +23,7 @@ DEFAULT_ACTIONS = {
 }
 
 
+@functools.lru_cache(maxsize=256)
 def _normalize_key_name(name: str) -> int:
     """Translate a human-friendly key name to an arcade.key constant.
 
@@ -53,6 +55,8 @@ class InputManager:
     ) -> None:
         self.window = window
         self._mapping: Dict[str, Set[int]] = {}
+        # Inverse of _mapping (key code -> actions), kept in mapping order
+        self._key_to_actions: Dict[int, List[str]] = {}
         self._pressed: Set[int] = set()
 
         if not mapping:
@@ -64,6 +68,14 @@ class InputManager:
         for action, key_names in mapping.items():
             keys = {_normalize_key_name(name) for name in key_names}
             self._mapping[action] = keys
+        self._rebuild_key_index()
+
+    def _rebuild_key_index(self) -> None:
+        index: Dict[int, List[str]] = {}
+        for action, keys in self._mapping.items():
+            for key in keys:
+                index.setdefault(key, []).append(action)
+        self._key_to_actions = index
 
     @staticmethod
     def _default_mapping() -> Dict[str, Iterable[str]]:
@@ -81,31 +93,36 @@ class InputManager:
 
     # Query helpers
     def actions_for_key(self, key: int) -> List[str]:
-        actions = [action for action, keys in self._mapping.items() if key in keys]
-        logger.debug("Key %s maps to actions %s", key, actions)
+        actions = list(self._key_to_actions.get(key, ()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Key %s maps to actions %s", key, actions)
         return actions
 
     # Event processing
     def process_key_press(self, key: int, modifiers: int) -> List[str]:
         self._pressed.add(key)
         actions = self.actions_for_key(key)
-        logger.debug("Key pressed %s mods=%s actions=%s", key, modifiers, actions)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Key pressed %s mods=%s actions=%s", key, modifiers, actions)
         return actions
 
     def process_key_release(self, key: int, modifiers: int) -> List[str]:
         self._pressed.discard(key)
         actions = self.actions_for_key(key)
-        logger.debug("Key released %s mods=%s actions=%s", key, modifiers, actions)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Key released %s mods=%s actions=%s", key, modifiers, actions)
         return actions
 
     # Binding management
     def bind(self, action: str, keys: Iterable[str]) -> None:
         self._mapping[action] = {_normalize_key_name(k) for k in keys}
+        self._rebuild_key_index()
         logger.info("Bound action '%s' to keys %s", action, keys)
 
     def unbind(self, action: str) -> None:
         if action in self._mapping:
             del self._mapping[action]
+            self._rebuild_key_index()
             logger.info("Unbound action '%s'", action)
 
     def is_pressed(self, action: str) -> bool:
@@ -5,14 +5,61 @@ import logging
 from dataclasses import dataclass, field
 from importlib import resources
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterable, Optional, Tuple
 
 import yaml
 
 logger = logging.getLogger(__name__)
 
+# Prefer the LibYAML-backed loader/dumper when PyYAML was built with it.
+_CSafeLoader = getattr(yaml, "CSafeLoader", None)
+_CSafeDumper = getattr(yaml, "CSafeDumper", None)
 
-@dataclass
+
+def _yaml_load(stream) -> dict:
+    if _CSafeLoader is not None:
+        return yaml.load(stream, Loader=_CSafeLoader) or {}
+    return yaml.safe_load(stream) or {}
+
+
+def _yaml_dump(data: dict, stream) -> None:
+    if _CSafeDumper is not None:
+        yaml.dump(data, stream, Dumper=_CSafeDumper, sort_keys=False)
+    else:
+        yaml.safe_dump(data, stream, sort_keys=False)
+
+
+def _read_default_settings_text() -> Optional[str]:
+    try:
+        return (
+            resources.files("amormortuorum.config")
+            .joinpath("default_settings.yaml")
+            .read_text(encoding="utf-8")
+        )
+    except FileNotFoundError:
+        return None
+
+
+# Packaged defaults, resolved once at import (avoids reopening the resource,
+# e.g. a zipped wheel, on every load).
+_DEFAULT_SETTINGS_TEXT = _read_default_settings_text()
+
+# Parsed YAML caches (see Settings.clear_cache). The packaged defaults never
+# change at runtime; user files are keyed by path and revalidated via stat.
+_DEFAULT_CACHE: Optional[dict] = None
+_USER_CACHE: Dict[str, Tuple[int, int, dict]] = {}
+
+
+def _fields_dict(obj) -> dict:
+    """Shallow field dict for a flat slotted dataclass (cheaper than asdict)."""
+    return {name: getattr(obj, name) for name in obj.__slots__}
+
+
+def _overlay(base: Optional[dict], override: Optional[dict]) -> dict:
+    return {**(base or {}), **(override or {})}
+
+
+@dataclass(slots=True)
 class VideoSettings:
     width: int = 1280
     height: int = 720
@@ -21,18 +68,18 @@ class VideoSettings:
     ui_scale: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioSettings:
     music_volume: float = 0.6
     sfx_volume: float = 0.8
 
 
-@dataclass
+@dataclass(slots=True)
 class InputSettings:
     mapping: Dict[str, Iterable[str]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     video: VideoSettings = field(default_factory=VideoSettings)
     audio: AudioSettings = field(default_factory=AudioSettings)
@@ -41,24 +88,41 @@ class Settings:
     @staticmethod
     def _load_yaml(path: Path) -> dict:
         with path.open("r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+            return _yaml_load(f)
 
-    @classmethod
-    def _deep_merge(cls, base: dict, overlay: dict) -> dict:
-        merged = dict(base)
-        for k, v in (overlay or {}).items():
-            if isinstance(v, dict) and isinstance(base.get(k), dict):
-                merged[k] = cls._deep_merge(base[k], v)
+    @staticmethod
+    def _load_default_data() -> dict:
+        global _DEFAULT_CACHE
+        if _DEFAULT_CACHE is None:
+            if _DEFAULT_SETTINGS_TEXT is not None:
+                _DEFAULT_CACHE = _yaml_load(_DEFAULT_SETTINGS_TEXT)
             else:
-                merged[k] = v
-        return merged
+                logger.warning("Default settings not found; falling back to dataclass defaults.")
+                _DEFAULT_CACHE = dataclasses.asdict(Settings())
+        return _DEFAULT_CACHE
 
     @classmethod
-    def _from_dict(cls, data: dict) -> "Settings":
-        video = VideoSettings(**data.get("video", {}))
-        audio = AudioSettings(**data.get("audio", {}))
-        input_ = InputSettings(mapping=data.get("input", {}).get("mapping", {}))
-        return Settings(video=video, audio=audio, input=input_)
+    def _load_user_data(cls, path: Path) -> dict:
+        """Parse a user settings file, reusing the last parse if it is unchanged.
+
+        Raises FileNotFoundError if the file does not exist.
+        """
+        st = path.stat()
+        key = str(path)
+        cached = _USER_CACHE.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            data = cached[2]
+        else:
+            data = cls._load_yaml(path)
+            _USER_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+        return data
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop cached default and user settings parses."""
+        global _DEFAULT_CACHE
+        _DEFAULT_CACHE = None
+        _USER_CACHE.clear()
 
     @classmethod
     def load(cls, user_path: Optional[Path] = None) -> "Settings":
@@ -66,37 +130,37 @@ class Settings:
 
         If user_path is provided and exists, overlay values onto defaults.
         """
-        # Load default YAML from package resources
-        try:
-            default_settings_path = resources.files("amormortuorum.config").joinpath(
-                "default_settings.yaml"
-            )
-            with default_settings_path.open("r", encoding="utf-8") as f:
-                default_data = yaml.safe_load(f) or {}
-        except FileNotFoundError:
-            logger.warning("Default settings not found; falling back to dataclass defaults.")
-            default_data = dataclasses.asdict(Settings())
+        # Load default YAML from package resources (parsed once per process)
+        default_data = cls._load_default_data()
 
         user_data = {}
         if user_path is not None:
-            if user_path.exists():
-                user_data = cls._load_yaml(user_path)
+            try:
+                user_data = cls._load_user_data(user_path)
                 logger.info("Loaded user settings from %s", user_path)
-            else:
+            except FileNotFoundError:
                 logger.warning("User settings file not found: %s", user_path)
 
-        merged = cls._deep_merge(default_data, user_data)
-        settings = cls._from_dict(merged)
+        # Build each section straight from its two sources; no merged tree
+        video = VideoSettings(**_overlay(default_data.get("video"), user_data.get("video")))
+        audio = AudioSettings(**_overlay(default_data.get("audio"), user_data.get("audio")))
+        mapping = _overlay(
+            (default_data.get("input") or {}).get("mapping"),
+            (user_data.get("input") or {}).get("mapping"),
+        )
+        # Copy key lists so callers can edit bindings without touching the caches
+        input_ = InputSettings(mapping={action: list(keys) for action, keys in mapping.items()})
+        settings = cls(video=video, audio=audio, input=input_)
         logger.debug("Settings merged: %s", settings)
         return settings
 
     def save(self, path: Path) -> None:
         data = {
-            "video": dataclasses.asdict(self.video),
-            "audio": dataclasses.asdict(self.audio),
+            "video": _fields_dict(self.video),
+            "audio": _fields_dict(self.audio),
             "input": {"mapping": {k: list(v) for k, v in self.input.mapping.items()}},
         }
         path.parent.mkdir(parents=True, exist_ok=True)
         with path.open("w", encoding="utf-8") as f:
-            yaml.safe_dump(data, f, sort_keys=False)
+            _yaml_dump(data, f)
         logger.info("Saved settings to %s", path)
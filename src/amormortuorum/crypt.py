@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence
 
 from .errors import CryptFull, InvalidOperation, NotFound
 from .models import ItemCatalog, Player
@@ -11,11 +11,29 @@ from .save import SaveData, CryptSlot
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CryptConfig:
     slots: int = 3
 
 
+class _SlotsView(Sequence[CryptSlot]):
+    """Read-only, non-copying view over the crypt slots of a save."""
+
+    __slots__ = ("_save",)
+
+    def __init__(self, save: SaveData) -> None:
+        self._save = save
+
+    def __getitem__(self, index):
+        return self._save.crypt[index]
+
+    def __len__(self) -> int:
+        return len(self._save.crypt)
+
+    def __iter__(self) -> Iterator[CryptSlot]:
+        return iter(self._save.crypt)
+
+
 class Crypt:
     """Persistent item storage across runs.
 
@@ -31,12 +49,20 @@ class Crypt:
         self.save = save
         self.catalog = catalog or ItemCatalog()
         self.config = config or CryptConfig()
-        # Normalize crypt slots (enforce positive quantities)
-        self.save.crypt = [s for s in self.save.crypt if s.quantity > 0][: self.config.slots]
+        # Normalize crypt slots (enforce positive quantities); skip the rebuild
+        # when the save is already clean, which is the common case.
+        crypt = self.save.crypt
+        if len(crypt) > self.config.slots or any(s.quantity <= 0 for s in crypt):
+            self.save.crypt = [s for s in crypt if s.quantity > 0][: self.config.slots]
 
     def list_slots(self) -> List[CryptSlot]:
+        """Return a snapshot copy of the slots. Prefer slots_view() for polling."""
         return list(self.save.crypt)
 
+    def slots_view(self) -> Sequence[CryptSlot]:
+        """Return a live read-only view of the slots without copying them."""
+        return _SlotsView(self.save)
+
     def deposit(self, player: Player, item_id: str, quantity: int = 1) -> None:
         if quantity <= 0:
             raise InvalidOperation("Deposit quantity must be positive")
@@ -51,14 +77,16 @@ class Crypt:
             if slot.item_id == item.id:
                 slot.quantity += quantity
                 player.inventory.remove(item, quantity)
-                logger.debug("Deposited %s into existing crypt slot: %s", quantity, slot)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Deposited %s into existing crypt slot: %s", quantity, slot)
                 return
         # Need a new slot
         if len(self.save.crypt) >= self.config.slots:
             raise CryptFull("Crypt is full (3 slots)")
         self.save.crypt.append(CryptSlot(item_id=item.id, quantity=quantity))
         player.inventory.remove(item, quantity)
-        logger.debug("Deposited %s of %s into new crypt slot", quantity, item.id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Deposited %s of %s into new crypt slot", quantity, item.id)
 
     def withdraw(self, player: Player, slot_index: int, quantity: Optional[int] = None) -> None:
         if not (0 <= slot_index < len(self.save.crypt)):
@@ -79,10 +107,11 @@ class Crypt:
         if slot.quantity == 0:
             # Remove empty slot to free capacity
             self.save.crypt.pop(slot_index)
-        logger.debug(
-            "Withdrew %s of %s from crypt slot %s; remaining: %s",
-            quantity,
-            item.id,
-            slot_index,
-            slot.quantity if slot_index < len(self.save.crypt) else 0,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Withdrew %s of %s from crypt slot %s; remaining: %s",
+                quantity,
+                item.id,
+                slot_index,
+                slot.quantity if slot_index < len(self.save.crypt) else 0,
+            )
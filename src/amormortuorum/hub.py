@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import logging
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterator, Optional
 
 from .models import Player, ItemCatalog
 from .shop import Shop
@@ -26,7 +27,8 @@ class GraveyardHub:
     - Construct with a SaveManager (optionally pointing to a custom root dir)
     - Call enter() per visit to the Graveyard to restock the shop deterministically
     - Use rest(), shop.buy(), crypt.deposit()/withdraw() as needed
-    - All crypt changes persist via SaveManager.save()
+    - All crypt changes persist via SaveManager.save(); wrap several changes in
+      ``with hub.batch():`` to write the save once at the end
     """
 
     def __init__(
@@ -37,6 +39,8 @@ class GraveyardHub:
         self.save_manager = save_manager or SaveManager()
         self.catalog = catalog or ItemCatalog()
         self._ctx: Optional[HubContext] = None
+        self._batch_depth = 0
+        self._dirty = False
 
     def enter(self) -> HubContext:
         save = self.save_manager.load()
@@ -60,10 +64,33 @@ class GraveyardHub:
         player.heal_full()
         logger.info("Player rested at the Graveyard and is fully healed.")
 
+    # Persistence batching
+    @contextmanager
+    def batch(self) -> Iterator["GraveyardHub"]:
+        """Defer crypt persistence until the outermost block exits, then save once."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write pending crypt changes to disk, if any."""
+        if self._dirty:
+            self.save_manager.save(self.ctx.save)
+            self._dirty = False
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+
     # Convenience wrappers that also persist crypt changes
     def crypt_deposit(self, player: Player, item_id: str, quantity: int = 1) -> None:
         self.ctx.crypt.deposit(player, item_id, quantity)
-        self.save_manager.save(self.ctx.save)
+        self._mark_dirty()
 
     def crypt_withdraw(
         self,
@@ -72,7 +99,7 @@ class GraveyardHub:
         quantity: Optional[int] = None,
     ) -> None:
         self.ctx.crypt.withdraw(player, slot_index, quantity)
-        self.save_manager.save(self.ctx.save)
+        self._mark_dirty()
 
     def snapshot(self) -> SaveData:
         """Return a snapshot of current save/meta state."""
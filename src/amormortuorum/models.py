@@ -1,16 +1,17 @@
 from __future__ import annotations
 
 import logging
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, Optional
 
-from .errors import InvalidOperation, NotFound
+from .errors import InsufficientGold, InvalidOperation, NotFound
 from .config import DEFAULT_ITEMS
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Item:
     id: str
     name: str
@@ -30,8 +31,10 @@ class ItemCatalog:
     def __init__(self, items: Optional[Dict[str, Dict]] = None):
         if items is None:
             items = DEFAULT_ITEMS
+        # Intern ids: they are used as dict keys and compared across shop/crypt
         self._items: Dict[str, Item] = {
-            iid: Item(**data) for iid, data in items.items()
+            sys.intern(iid): Item(**{**data, "id": sys.intern(data["id"])})
+            for iid, data in items.items()
         }
 
     def get(self, item_id: str) -> Item:
@@ -44,7 +47,7 @@ class ItemCatalog:
         return item_id in self._items
 
 
-@dataclass
+@dataclass(slots=True)
 class Inventory:
     items: Dict[str, int] = field(default_factory=dict)
 
@@ -86,23 +89,24 @@ class Player:
     inventory: Inventory = field(default_factory=Inventory)
 
     def heal_full(self) -> None:
-        logger.debug("Healing player to full HP: %s -> %s", self.hp, self.max_hp)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Healing player to full HP: %s -> %s", self.hp, self.max_hp)
         self.hp = self.max_hp
 
     def spend_gold(self, amount: int) -> None:
         if amount < 0:
             raise InvalidOperation("Cannot spend negative gold")
         if self.gold < amount:
-            from .errors import InsufficientGold
-
             raise InsufficientGold(
                 f"Insufficient gold: have {self.gold}, need {amount}"
             )
-        logger.debug("Spending gold: %s - %s", self.gold, amount)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Spending gold: %s - %s", self.gold, amount)
         self.gold -= amount
 
     def add_gold(self, amount: int) -> None:
         if amount < 0:
             raise InvalidOperation("Cannot add negative gold")
-        logger.debug("Adding gold: %s + %s", self.gold, amount)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Adding gold: %s + %s", self.gold, amount)
         self.gold += amount
@@ -24,7 +24,7 @@ DEFAULT_RELIC_IDS: Set[str] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     """A persistable description of an item.
 
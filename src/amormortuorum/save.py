@@ -1,21 +1,21 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
 import shutil
+import sys
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from .config import get_paths
+from .config import dump_json, get_paths, load_json
 
 logger = logging.getLogger(__name__)
 
 SAVE_VERSION = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class CryptSlot:
     item_id: str
     quantity: int
@@ -49,6 +49,10 @@ class SaveData:
                 data.get("version"),
             )
         crypt_slots = [CryptSlot(**s) for s in data.get("crypt", [])]
+        for slot in crypt_slots:
+            # Match the interned ids used by the item catalog
+            if isinstance(slot.item_id, str):
+                slot.item_id = sys.intern(slot.item_id)
         return cls(
             version=data.get("version", SAVE_VERSION),
             meta_seed=int(data.get("meta_seed", 1337)),
@@ -83,8 +87,7 @@ class SaveManager:
             self._cache = SaveData()
             self._atomic_write(self._cache.to_json())
             return self._cache
-        with self.save_path.open("r", encoding="utf-8") as f:
-            raw = json.load(f)
+        raw = load_json(self.save_path)
         self._cache = SaveData.from_json(raw)
         return self._cache
 
@@ -94,8 +97,7 @@ class SaveManager:
 
     def _atomic_write(self, payload: Dict) -> None:
         tmp_path = self.save_path.with_suffix(self.save_path.suffix + ".tmp")
-        with tmp_path.open("w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, sort_keys=True)
+        dump_json(tmp_path, payload)
         bak_path = self.save_path.with_suffix(self.save_path.suffix + ".bak")
         if self.save_path.exists():
             bak_path.parent.mkdir(parents=True, exist_ok=True)
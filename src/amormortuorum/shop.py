@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import logging
 import random
+import sys
 from dataclasses import dataclass
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping
 
 from .models import ItemCatalog, Player
 from .errors import OutOfStock
@@ -12,7 +14,7 @@ from .config import DEFAULT_SHOP_POOL
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class StockEntry:
     price: int
     quantity: int
@@ -28,11 +30,21 @@ class Shop:
     def __init__(self, catalog: ItemCatalog | None = None):
         self.catalog = catalog or ItemCatalog()
         self._stock: Dict[str, StockEntry] = {}
+        self._stock_view: Mapping[str, StockEntry] = MappingProxyType(self._stock)
         self.cycle_id: int = -1
 
     def stock(self) -> Dict[str, StockEntry]:
+        """Return a snapshot copy of current stock; safe to buy while iterating it."""
         return dict(self._stock)
 
+    def stock_view(self) -> Mapping[str, StockEntry]:
+        """Return a live read-only view of current stock without copying it.
+
+        The view tracks purchases and restocks for the Shop's lifetime, so it is
+        suited to polling UIs. Do not buy while iterating it; use stock() instead.
+        """
+        return self._stock_view
+
     def restock(self, seed: int, cycle: int, pool: Dict[str, Dict] | None = None) -> None:
         pool = pool or DEFAULT_SHOP_POOL
         rng = random.Random((seed << 16) ^ cycle)
@@ -46,18 +58,21 @@ class Shop:
             price = int(spec["price"])
             if qty <= 0:
                 continue
-            new_stock[item_id] = StockEntry(price=price, quantity=qty)
-        self._stock = new_stock
+            new_stock[sys.intern(item_id)] = StockEntry(price=price, quantity=qty)
+        # Refill in place so views handed out by stock_view() stay current
+        self._stock.clear()
+        self._stock.update(new_stock)
         self.cycle_id = cycle
-        logger.debug("Restocked shop for cycle %s: %s", cycle, self._stock)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Restocked shop for cycle %s: %s", cycle, self._stock)
 
     def buy(self, player: Player, item_id: str, quantity: int = 1) -> None:
         if quantity <= 0:
             raise ValueError("Quantity must be positive")
-        if item_id not in self._stock:
-            raise OutOfStock(f"Item '{item_id}' is not available this cycle")
-        entry = self._stock[item_id]
-        if entry.quantity < quantity:
+        entry = self._stock.get(item_id)
+        if entry is None or entry.quantity < quantity:
+            if entry is None:
+                raise OutOfStock(f"Item '{item_id}' is not available this cycle")
             raise OutOfStock(
                 f"Only {entry.quantity}x of '{item_id}' left in stock; requested {quantity}"
             )
@@ -71,10 +86,11 @@ class Shop:
         entry.quantity -= quantity
         if entry.quantity == 0:
             del self._stock[item_id]
-        logger.debug(
-            "Purchase complete: %sx %s for %s gold; remaining stock: %s",
-            quantity,
-            item_id,
-            total_price,
-            entry.quantity if item_id in self._stock else 0,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Purchase complete: %sx %s for %s gold; remaining stock: %s",
+                quantity,
+                item_id,
+                total_price,
+                entry.quantity if item_id in self._stock else 0,
+            )
@@ -0,0 +1,68 @@
+from typing import Dict, List, Optional
+
+from src.am_epic.epic_manager import CHECKLIST_END, CHECKLIST_START, EpicManager
+from src.am_epic.models import EpicSpec
+
+
+class FakeGitHub:
+    def __init__(self) -> None:
+        self.issues: Dict[int, Dict] = {}
+        self.comments: Dict[int, List[Dict]] = {}
+        self.get_issue_calls = 0
+
+    def ensure_label(self, name: str, color: str = "", description: Optional[str] = None):
+        return {"name": name}
+
+    def search_issue_by_title(self, title: str) -> Optional[Dict]:
+        return next((i for i in self.issues.values() if i["title"] == title), None)
+
+    def create_issue(self, title, body, labels=None, assignees=None) -> Dict:
+        number = len(self.issues) + 1
+        issue = {"number": number, "title": title, "body": body, "state": "open", "labels": labels}
+        self.issues[number] = issue
+        return issue
+
+    def update_issue(self, number: int, *, body: Optional[str] = None, **_) -> Dict:
+        if body is not None:
+            self.issues[number]["body"] = body
+        return self.issues[number]
+
+    def add_labels(self, number: int, labels: List[str]):
+        return []
+
+    def get_issue(self, number: int) -> Dict:
+        self.get_issue_calls += 1
+        return self.issues[number]
+
+    def list_comments(self, number: int) -> List[Dict]:
+        return list(self.comments.get(number, []))
+
+    def create_comment(self, number: int, body: str) -> Dict:
+        comment = {"id": number * 100 + len(self.comments.get(number, [])), "body": body}
+        self.comments.setdefault(number, []).append(comment)
+        return comment
+
+    def update_comment(self, comment_id: int, body: str) -> Dict:
+        return {"id": comment_id, "body": body}
+
+
+def test_apply_builds_checklist_without_refetching_children():
+    gh = FakeGitHub()
+    spec = EpicSpec.from_dict(
+        {
+            "epic": {"title": "EPIC: Save", "body": "Epic body"},
+            "children": [
+                {"title": "Child A", "body": "a"},
+                {"title": "Child B", "body": "b"},
+            ],
+        }
+    )
+    result = EpicManager(gh).apply(spec)
+
+    assert result == {"epic": 1, "children": 2}
+    assert gh.get_issue_calls == 0
+    body = gh.issues[1]["body"]
+    assert CHECKLIST_START in body and CHECKLIST_END in body
+    assert "  - [ ] #2 Child A" in body
+    assert "  - [ ] #3 Child B" in body
+    assert "- #3 Child B" in gh.comments[1][0]["body"]
@@ -62,3 +62,151 @@ def test_error_response_raises():
     )
     with pytest.raises(GitHubAPIError):
         gh.create_issue("t", "b")
+
+
+@responses.activate
+def test_get_retries_server_error_then_succeeds(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("src.am_epic.github_client.time.sleep", sleeps.append)
+    gh = GitHubClient(token="tok", repo="o/r")
+    url = "https://api.github.com/repos/o/r/issues/7"
+    responses.add(responses.GET, url, status=502)
+    responses.add(responses.GET, url, status=429, headers={"Retry-After": "2"})
+    responses.add(responses.GET, url, json={"number": 7}, status=200)
+    assert gh.get_issue(7)["number"] == 7
+    assert sleeps == [0.5, 2.0]
+
+
+@responses.activate
+def test_post_server_error_is_not_retried(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("src.am_epic.github_client.time.sleep", sleeps.append)
+    gh = GitHubClient(token="tok", repo="o/r")
+    responses.add(responses.POST, "https://api.github.com/repos/o/r/issues", status=502)
+    with pytest.raises(GitHubAPIError, match="502"):
+        gh.create_issue("t", "b")
+    assert sleeps == []
+
+
+@responses.activate
+def test_secondary_rate_limit_403_is_retried(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("src.am_epic.github_client.time.sleep", sleeps.append)
+    gh = GitHubClient(token="tok", repo="o/r")
+    url = "https://api.github.com/repos/o/r/issues"
+    responses.add(responses.POST, url, status=403, headers={"Retry-After": "3"})
+    responses.add(responses.POST, url, json={"number": 1}, status=201)
+    assert gh.create_issue("t", "b")["number"] == 1
+    assert sleeps == [3.0]
+
+
+@responses.activate
+def test_long_rate_limit_wait_fails_fast(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("src.am_epic.github_client.time.sleep", sleeps.append)
+    gh = GitHubClient(token="tok", repo="o/r")
+    responses.add(
+        responses.GET,
+        "https://api.github.com/repos/o/r/issues/7",
+        status=403,
+        headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "9999999999"},
+    )
+    with pytest.raises(GitHubAPIError, match="403"):
+        gh.get_issue(7)
+    assert sleeps == []
+
+
+@responses.activate
+def test_get_label_retries_and_does_not_create_on_server_error(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("src.am_epic.github_client.time.sleep", sleeps.append)
+    gh = GitHubClient(token="tok", repo="o/r", max_retries=1)
+    url = "https://api.github.com/repos/o/r/labels/epic"
+    responses.add(responses.GET, url, status=503)
+    responses.add(responses.GET, url, status=503)
+    with pytest.raises(GitHubAPIError, match="503"):
+        gh.ensure_label("epic")
+    assert sleeps == [0.5]
+
+
+@responses.activate
+def test_get_retries_connection_error(monkeypatch):
+    import requests
+
+    sleeps = []
+    monkeypatch.setattr("src.am_epic.github_client.time.sleep", sleeps.append)
+    gh = GitHubClient(token="tok", repo="o/r")
+    responses.add(responses.GET, "https://api.github.com/repos/o/r/issues/7", json={"number": 7})
+    real_request = gh.session.request
+    failures = [requests.RequestException("connection reset")]
+
+    def flaky_request(*args, **kwargs):
+        if failures:
+            raise failures.pop()
+        return real_request(*args, **kwargs)
+
+    monkeypatch.setattr(gh.session, "request", flaky_request)
+    assert gh.get_issue(7)["number"] == 7
+    assert sleeps == [0.5]
+
+    failures.append(requests.RequestException("timed out"))
+    with pytest.raises(GitHubAPIError, match="timed out"):
+        gh.create_issue("t", "b")
+    assert sleeps == [0.5]
+
+
+@responses.activate
+def test_low_remaining_quota_pauses_until_reset(monkeypatch):
+    import time
+
+    sleeps = []
+    monkeypatch.setattr("src.am_epic.github_client.time.sleep", sleeps.append)
+    gh = GitHubClient(token="tok", repo="o/r")
+    url = "https://api.github.com/repos/o/r/issues/7"
+    reset = str(int(time.time()) + 5)
+    responses.add(
+        responses.GET,
+        url,
+        json={"number": 7},
+        headers={"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": reset},
+    )
+    responses.add(responses.GET, url, json={"number": 7})
+    gh.get_issue(7)
+    assert sleeps == []
+    gh.get_issue(7)
+    assert len(sleeps) == 1 and 0 < sleeps[0] <= 5
+
+
+def test_create_issues_bulk_preserves_order():
+    gh = GitHubClient(token="tok", repo="o/r")
+    created = []
+
+    def fake_create_issue(title, body, labels=None, assignees=None):
+        created.append(title)
+        return {"title": title, "labels": labels}
+
+    gh.create_issue = fake_create_issue
+    specs = [{"title": f"T{i}", "body": "b", "labels": ["x"]} for i in range(10)]
+    issues = gh.create_issues_bulk(specs, max_workers=4)
+    assert [i["title"] for i in issues] == [s["title"] for s in specs]
+    assert sorted(created) == sorted(s["title"] for s in specs)
+    assert gh.create_issues_bulk([]) == []
+
+
+def test_create_issues_bulk_uses_a_session_per_worker():
+    gh = GitHubClient(token="tok", repo="o/r")
+
+    def fake_create_issue(title, body, labels=None, assignees=None):
+        return {"title": title, "session": getattr(gh._local, "session", None)}
+
+    gh.create_issue = fake_create_issue
+    specs = [{"title": f"T{i}", "body": "b"} for i in range(6)]
+
+    serial = gh.create_issues_bulk(specs, max_workers=1)
+    assert all(i["session"] is None for i in serial)
+
+    parallel = gh.create_issues_bulk(specs)
+    sessions = {id(i["session"]) for i in parallel}
+    assert None not in (i["session"] for i in parallel)
+    assert id(gh.session) not in sessions
+    assert 1 <= len(sessions) <= 2
@@ -62,6 +62,22 @@ def test_shop_limited_stock_and_purchase(tmp_path: Path):
         pass
 
 
+def test_shop_buy_out_while_iterating_stock_and_view_tracks_changes(tmp_path: Path):
+    hub = make_hub(tmp_path)
+    shop = hub.enter().shop
+    view = shop.stock_view()
+    player = Player(gold=1_000_000)
+
+    for item_id, entry in shop.stock().items():
+        shop.buy(player, item_id, quantity=entry.quantity)
+    assert shop.stock() == {}
+    assert len(view) == 0
+
+    shop.restock(seed=42, cycle=1)
+    assert dict(view) == shop.stock()
+    assert len(view) > 0
+
+
 def test_shop_restock_is_deterministic(tmp_path: Path):
     hub = make_hub(tmp_path)
     ctx1 = hub.enter()
@@ -175,3 +191,115 @@ def test_atomic_save(tmp_path: Path):
     # Validate json is parseable
     with save_path.open("r", encoding="utf-8") as f:
         json.load(f)
+
+
+def test_crypt_slots_view_tracks_changes(tmp_path: Path):
+    hub = make_hub(tmp_path)
+    ctx = hub.enter()
+    player = Player()
+    player.inventory.add(ItemCatalog().get("antidote"), 3)
+    view = ctx.crypt.slots_view()
+    assert len(view) == 0
+
+    hub.crypt_deposit(player, "antidote", 2)
+    assert len(view) == 1
+    assert view[0].item_id == "antidote"
+    assert [s.quantity for s in view] == [2]
+    assert not hasattr(view, "append")
+
+
+def test_crypt_normalizes_dirty_slots(tmp_path: Path):
+    from amormortuorum.crypt import Crypt
+    from amormortuorum.save import CryptSlot, SaveData
+
+    clean = SaveData(crypt=[CryptSlot("antidote", 1)])
+    slots = clean.crypt
+    Crypt(clean)
+    assert clean.crypt is slots
+
+    dirty = SaveData(
+        crypt=[
+            CryptSlot("antidote", 0),
+            CryptSlot("potion_small", 2),
+            CryptSlot("scroll_embers", 1),
+            CryptSlot("antidote", 4),
+            CryptSlot("potion_small", 1),
+        ]
+    )
+    Crypt(dirty)
+    assert [(s.item_id, s.quantity) for s in dirty.crypt] == [
+        ("potion_small", 2),
+        ("scroll_embers", 1),
+        ("antidote", 4),
+    ]
+
+
+def test_crypt_deposit_after_external_slot_changes():
+    from amormortuorum.crypt import Crypt
+    from amormortuorum.save import CryptSlot, SaveData
+
+    save = SaveData(crypt=[CryptSlot("antidote", 1)])
+    crypt = Crypt(save)
+    player = Player()
+    player.inventory.add(ItemCatalog().get("antidote"), 3)
+
+    save.crypt = []
+    crypt.deposit(player, "antidote", 1)
+    assert [(s.item_id, s.quantity) for s in save.crypt] == [("antidote", 1)]
+
+    save.crypt.insert(0, CryptSlot("potion_small", 2))
+    crypt.deposit(player, "antidote", 2)
+    assert [(s.item_id, s.quantity) for s in save.crypt] == [
+        ("potion_small", 2),
+        ("antidote", 3),
+    ]
+
+
+def test_hub_enters_with_non_string_crypt_item_id(tmp_path: Path):
+    sm = SaveManager(root=tmp_path)
+    data = sm.load()
+    data.crypt = []
+    sm.save(data)
+    raw = json.loads(sm.save_path.read_text(encoding="utf-8"))
+    raw["crypt"] = [{"item_id": 7, "quantity": 1}]
+    sm.save_path.write_text(json.dumps(raw), encoding="utf-8")
+
+    hub = GraveyardHub(save_manager=SaveManager(root=tmp_path), catalog=ItemCatalog())
+    ctx = hub.enter()
+    assert ctx.crypt.list_slots()[0].item_id == 7
+    try:
+        hub.crypt_withdraw(Player(), 0)
+        assert False, "Expected NotFound"
+    except NotFound:
+        pass
+
+
+def test_batch_defers_crypt_saves_until_exit(tmp_path: Path):
+    hub = make_hub(tmp_path)
+    hub.enter()
+    player = Player()
+    cat = ItemCatalog()
+    player.inventory.add(cat.get("potion_small"), 5)
+    player.inventory.add(cat.get("antidote"), 2)
+
+    saves = []
+    real_save = hub.save_manager.save
+    hub.save_manager.save = lambda data: (saves.append(data), real_save(data))
+
+    with hub.batch():
+        hub.crypt_deposit(player, "potion_small", 2)
+        hub.crypt_deposit(player, "potion_small", 3)
+        hub.crypt_deposit(player, "antidote", 2)
+        hub.crypt_withdraw(player, 1, 1)
+        assert saves == []
+    assert len(saves) == 1
+
+    on_disk = json.loads(hub.save_manager.save_path.read_text(encoding="utf-8"))
+    assert on_disk["crypt"] == [
+        {"item_id": "potion_small", "quantity": 5},
+        {"item_id": "antidote", "quantity": 1},
+    ]
+
+    # Outside a batch every change is still written immediately
+    hub.crypt_withdraw(player, 1)
+    assert len(saves) == 2
@@ -33,3 +33,14 @@ def test_binding_and_press_release_flow():
     actions = im.process_key_release(arcade.key.SPACE, modifiers=0)
     assert actions == ["confirm"]
     assert im.is_pressed("confirm") is False
+
+
+def test_rebind_and_unbind_update_key_lookup():
+    im = InputManager(DummyWindow(), mapping={"confirm": ["ENTER"], "pause": ["P"]})
+    im.bind("confirm", ["SPACE"])
+    assert im.actions_for_key(arcade.key.ENTER) == []
+    assert im.actions_for_key(arcade.key.SPACE) == ["confirm"]
+    im.bind("menu", ["P"])
+    assert im.actions_for_key(arcade.key.P) == ["pause", "menu"]
+    im.unbind("pause")
+    assert im.actions_for_key(arcade.key.P) == ["menu"]
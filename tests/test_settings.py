@@ -32,3 +32,31 @@ def test_user_override_merge(tmp_path: Path):
     assert s.audio.music_volume == 0.25
     # Confirm mapping overridden to single key
     assert s.input.mapping["confirm"] == ["ENTER"]
+
+
+def test_user_settings_cache_revalidates_on_change(tmp_path: Path):
+    user = tmp_path / "settings.yaml"
+    user.write_text(yaml.safe_dump({"video": {"width": 1024}}), encoding="utf-8")
+    first = Settings.load(user_path=user)
+    first.input.mapping["confirm"].append("TAB")
+    assert Settings.load(user_path=user).video.width == 1024
+    # Mutating a loaded Settings must not leak into the cached defaults
+    assert "TAB" not in Settings.load().input.mapping["confirm"]
+
+    user.write_text(yaml.safe_dump({"video": {"width": 800, "height": 600}}), encoding="utf-8")
+    assert Settings.load(user_path=user).video.width == 800
+    Settings.clear_cache()
+    assert Settings.load(user_path=user).video.height == 600
+
+
+def test_save_round_trip(tmp_path: Path):
+    s = Settings.load()
+    s.video.width = 1600
+    s.audio.sfx_volume = 0.5
+    out = tmp_path / "out" / "settings.yaml"
+    s.save(out)
+    loaded = Settings.load(user_path=out)
+    assert loaded.video.width == 1600
+    assert loaded.video.height == 720
+    assert loaded.audio.sfx_volume == 0.5
+    assert loaded.input.mapping == s.input.mapping